@@ -42,6 +42,8 @@ class Cards:
             self._items = []
         else:
             self._items = [Card(card_str) for card_str in cards_str.split(" ")]
+        # 並びが未確定(引くときに1枚ずつランダムに決める)間だけ、山札専用の乱数を持つ
+        self._lazy_random: random.Random | None = None
 
     @classmethod
     def create_deck(cls) -> Cards:
@@ -55,16 +57,20 @@ class Cards:
     # Cardsクラスに対して == で判定するには __eq__ が必要
     def __eq__(self, value: object) -> bool:
         if isinstance(value, Cards):
+            self._settle_shuffle()
+            value._settle_shuffle()
             return self._items == value._items
         return False
 
     def __str__(self):
+        self._settle_shuffle()
         return " ".join([str(item) for item in self._items])
 
     def __len__(self) -> int:
         return len(self._items)
 
     def items(self) -> list[Card]:
+        self._settle_shuffle()
         return self._items[:]
 
     def suits(self) -> set[str]:
@@ -91,20 +97,65 @@ class Cards:
     def remove(self, indexes: list[int]):
         # 要素の削除による配列のインデックス変化の影響を受けないように
         # 削除するインデックスを降順に並べ替えてから、要素を削除する
+        self._settle_shuffle()
         for index in sorted(indexes, reverse=True):
             del self._items[index]
 
     def add(self, card: Card) -> None:
+        self._settle_shuffle()
         self._items.append(card)
 
     def draw(self) -> Card:
+        if self._lazy_random is not None:
+            # 空のときは、通常の draw() と同じく IndexError にする
+            if not self._items:
+                raise IndexError("pop from empty list")
+            return self._draw_randomly(self._lazy_random)
         # リストの先頭から要素を取り出す
         # 最後から取り出すより、見た目の動作が理解しやすいので
         return self._items.pop(0)
 
+    def copy(self) -> Cards:
+        # Card は変更されないので、リストだけ複製すれば十分
+        # 乱数の状態も複製するので、並びが未確定でもコピー元と同じ順にカードが引かれる
+        cloned = Cards()
+        cloned._items = self._items[:]
+        if self._lazy_random is not None:
+            cloned._lazy_random = random.Random()
+            cloned._lazy_random.setstate(self._lazy_random.getstate())
+        return cloned
+
     def shuffle(self) -> None:
         random.shuffle(self._items)
+        self._lazy_random = None
+
+    def shuffle_lazily(self) -> None:
+        """シャッフルを遅延させる
 
+        並びは draw() のたびに1枚ずつ決めるので、引かれないカードの分の処理は発生しない。
+        並びが必要になった時点(items() など)で、残りのカードの並びをまとめて確定させる。
+        山札専用の乱数を使うので、並びを確定させても、確定させずに引いた場合と同じ順になる
+        """
+        # シードだけグローバルの random から取り、以降は山札専用の乱数を使う
+        self._lazy_random = random.Random(random.getrandbits(64))
+
+    def _draw_randomly(self, rng: random.Random) -> Card:
+        # 残りのカードから1枚をランダムに選んで取り出す
+        # (Fisher–Yates の1ステップ分。末尾と入れ替えて pop するので O(1))
+        index = rng.randrange(len(self._items))
+        self._items[index], self._items[-1] = self._items[-1], self._items[index]
+        return self._items.pop()
+
+    def _settle_shuffle(self) -> None:
+        # 遅延させていたシャッフルを確定させる
+        # draw() と同じ手順で残りを全て引いた順を、そのまま並びとする
+        if self._lazy_random is not None:
+            rng = self._lazy_random
+            self._lazy_random = None
+            settled = []
+            while self._items:
+                settled.append(self._draw_randomly(rng))
+            self._items = settled
 
 class Deck:
     def __init__(self, cards_str: str | None = None) -> None:
@@ -129,9 +180,10 @@ class Deck:
     def shuffled(self) -> Deck:
         # 元のクラスは変更せず、新しいインスタンスを返すようにする
         # 通常、メソッドチェーンは非破壊で実装するようなので
-        cloned_cards = copy.deepcopy(self._cards)
-        cloned_cards.shuffle()
-        new_deck = Deck()
+        # 山札は上から数枚しか引かれないことが多いので、シャッフルは引くときまで遅延させる
+        cloned_cards = self._cards.copy()
+        cloned_cards.shuffle_lazily()
+        new_deck = copy.copy(self)
         new_deck._cards = cloned_cards
         return new_deck
 
@@ -1,5 +1,7 @@
 from poker import Card, Cards, Deck, Hand, Dealer, Poker
 import unittest
+import copy
+import random
 from io import StringIO
 from unittest.mock import patch
 
@@ -178,6 +180,80 @@ class TestDeck(unittest.TestCase):
         self.assertEqual(len(normal_deck.cards()), len(shuffled_deck.cards()))
         self.assertNotEqual(normal_deck.cards(), shuffled_deck.cards())
 
+    def test_shuffled_draw(self):
+        normal_deck = Deck()
+        shuffled_deck = normal_deck.shuffled()
+
+        # シャッフル後の山札から全て引くと、全カードが1枚ずつ出てくる
+        drawn_cards = [shuffled_deck.draw() for _ in range(52)]
+        self.assertEqual(len(shuffled_deck), 0)
+        self.assertEqual(set(drawn_cards), set(normal_deck.cards()))
+        self.assertEqual(len(set(drawn_cards)), 52)
+
+        # 元の山札は変化しない
+        self.assertEqual(len(normal_deck), 52)
+
+    def test_shuffled_draw_empty(self):
+        shuffled_deck = Deck("♥2").shuffled()
+        shuffled_deck.draw()
+
+        # 山札が空のときに引くと、シャッフルしていない山札と同じく IndexError になる
+        with self.assertRaises(IndexError):
+            shuffled_deck.draw()
+
+    def test_shuffled_draw_is_random(self):
+        # 結果を固定するため、乱数のシードを指定
+        random.seed(0)
+
+        # シャッフル後に引いたカードは、シャッフルしていない山札の並びとは異なる
+        shuffled_deck = Deck().shuffled()
+        drawn_cards = [shuffled_deck.draw() for _ in range(52)]
+        self.assertNotEqual(drawn_cards, Deck().cards())
+
+        # 最初に引くカードは、どのカードもほぼ同じ回数だけ出てくる
+        counts = {Card("♥2"): 0, Card("♥3"): 0, Card("♥4"): 0, Card("♥5"): 0}
+        for _ in range(4000):
+            counts[Deck("♥2 ♥3 ♥4 ♥5").shuffled().draw()] += 1
+        for count in counts.values():
+            self.assertTrue(800 < count < 1200, counts)
+
+    def test_shuffled_copy(self):
+        shuffled_deck = Deck().shuffled()
+        cloned_deck = copy.deepcopy(shuffled_deck)
+
+        # コピーした山札からは、コピー元と同じ順にカードが引かれる
+        self.assertEqual(
+            [shuffled_deck.draw() for _ in range(5)],
+            [cloned_deck.draw() for _ in range(5)],
+        )
+
+    def test_shuffled_cards_does_not_change_draw(self):
+        shuffled_deck = Deck().shuffled()
+        cloned_deck = copy.deepcopy(shuffled_deck)
+
+        # 並びを参照しても、以降に引かれるカードや、グローバルの乱数には影響しない
+        random_state = random.getstate()
+        cards = shuffled_deck.cards()
+        self.assertEqual(random.getstate(), random_state)
+
+        drawn_cards = [shuffled_deck.draw() for _ in range(5)]
+        self.assertEqual(drawn_cards, cards[:5])
+        self.assertEqual(drawn_cards, [cloned_deck.draw() for _ in range(5)])
+
+    def test_shuffled_draw_and_cards(self):
+        shuffled_deck = Deck().shuffled()
+
+        # 数枚引いた後も、残りのカードには引いたカードが含まれない
+        drawn_cards = [shuffled_deck.draw() for _ in range(5)]
+        remaining_cards = shuffled_deck.cards()
+        self.assertEqual(len(remaining_cards), 47)
+        for card in drawn_cards:
+            self.assertNotIn(card, remaining_cards)
+
+        # 並びが確定した後は、cards() の先頭から順に引かれる
+        self.assertEqual(shuffled_deck.draw(), remaining_cards[0])
+        self.assertEqual(shuffled_deck.cards(), remaining_cards[1:])
+
 
 class TestHand(unittest.TestCase):
     def test_creation(self):